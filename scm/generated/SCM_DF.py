@@ -1,28 +1,28 @@
-# SCM_Utils is a library of utilities for the Space Cows Project
-# 
-# MIT License
-# 
-# Copyright (c) 2023 eResearch Centre, James Cook University
-# Author: NigelB
-# 
-# Permission is hereby granted, free of charge, to any person obtaining a copy
-# of this software and associated documentation files (the "Software"), to deal
-# in the Software without restriction, including without limitation the rights
-# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
-# copies of the Software, and to permit persons to whom the Software is
-# furnished to do so, subject to the following conditions:
-# 
-# The above copyright notice and this permission notice shall be included in all
-# copies or substantial portions of the Software.
-# 
-# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
-# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
-# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# SCM_Utils is a library of utilities for the Space Cows Project
+# 
+# MIT License
+# 
+# Copyright (c) 2023 eResearch Centre, James Cook University
+# Author: NigelB
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 
-# This file has been automatically generated by BitPacker.
+# This file has been automatically generated by BitPacker.
 # DO NOT EDIT IT or your changes will be overwritten.
 
 from enum import Enum
@@ -97,53 +97,62 @@ class EncodeError(Exception): pass
 
 
 class BitQueue:
+    # The queue is held as one big integer plus a bit count; fields are pushed and
+    # popped with shifts and masks instead of per-bit string manipulation.
     def __init__(self, source=""):
         self.source = source
-        if source.startswith("0x") or source.startswith("0X"):
-            self.source = source[2::]
-        if ' ' in self.source:
-            self.source = self.source.replace(" ", '')
-        self.data = None
+        if isinstance(source, str):
+            if source.startswith("0x") or source.startswith("0X"):
+                self.source = source[2::]
+            if ' ' in self.source:
+                self.source = self.source.replace(" ", '')
+        self._value = 0
+        self._bits = 0
         self.reset()
 
     def reset(self):
         if len(self.source) == 0:
-            self.data = ""
+            self._value = 0
+            self._bits = 0
             return
-        result = ""            
-        data = bytes.fromhex(self.source)
-        for i in data:
-            result = "{}{}".format(result, bin(i)[2:].zfill(8))
-        self.data = result
+        data = self.source if isinstance(self.source, (bytes, bytearray)) else bytes.fromhex(self.source)
+        self._value = int.from_bytes(data, 'big')
+        self._bits = len(data) * 8
 
-    def pop(self, count):
-        if self.size() == 0: raise Empty()
-        result = self.data[:count]
-        self.data = self.data[count:]
+    def pop_int(self, count):
+        if self._bits == 0: raise Empty()
+        shift = self._bits - count
+        if shift <= 0:
+            # Fewer bits remain than requested; hand back everything left.
+            result = self._value
+            self._value = 0
+            self._bits = 0
+            return result
+        result = self._value >> shift
+        self._value &= (1 << shift) - 1
+        self._bits = shift
         return result
 
+    def pop(self, count):
+        if self._bits == 0: raise Empty()
+        width = count if count < self._bits else self._bits
+        return format(self.pop_int(count), '0{}b'.format(width))
+
     def size(self):
-        return len(self.data)
+        return self._bits
 
     def clear(self):
-        self.data = ""
+        self._value = 0
+        self._bits = 0
 
-    def __push(self, bits):
-        symbols = {x:'' for x in bits}
-        _valid_symbols = {k:v for k, v in symbols.items() if k in [0, 1, '0', '1']}
-        if len(_valid_symbols.keys()) != len(symbols.keys()):
-            raise Exception("Invalid Symbols")
-        self.data = "{}{}".format(self.data, bits)
-    
     def push(self, value, bits):
         if hasattr(value, '__dict__') and isinstance(value, Enum):
-            value = value.value    
-        v = bin(value & int('1'*bits, 2))[2:]
-        self.__push(v.zfill(bits))
-    
+            value = value.value
+        self._value = (self._value << bits) | (value & ((1 << bits) - 1))
+        self._bits += bits
+
     def get_bytes(self):
-        pat = re.compile("."*8)
-        return bytes([int(i, 2) for i in pat.findall(self.data)])
+        return (self._value >> (self._bits % 8)).to_bytes(self._bits // 8, 'big')
 
 
 class SCM_DF_Transmission_Payload(Enum):
@@ -152,81 +161,81 @@ class SCM_DF_Transmission_Payload(Enum):
     SCM_DF_Transmission_Payload_Status_v1_0 = 2
 
 
-def scm_df_decode(hex_string):
-    q = BitQueue(source=hex_string)
+def scm_df_decode(message):
+    q = BitQueue(source=message)
     data = OrderedDict()
-    data['id'] = int(q.pop(4), 2)
-    data['crc16'] = int(q.pop(16), 2)
-    data['SF'] = int(q.pop(3), 2)
-    data['MC'] = int(q.pop(9), 2)
-    data['packet_type'] = SCM_DF_Transmission_Payload(int(q.pop(5), 2))
+    data['id'] = q.pop_int(4)
+    data['crc16'] = q.pop_int(16)
+    data['SF'] = q.pop_int(3)
+    data['MC'] = q.pop_int(9)
+    data['packet_type'] = SCM_DF_Transmission_Payload(q.pop_int(5))
     data['payload'] = OrderedDict()
     if data['packet_type'] == SCM_DF_Transmission_Payload.SCM_DF_Transmission_Payload_Tracking_v1_0:
         data['payload']['tracking_v1_0'] = OrderedDict()
-        data['payload']['tracking_v1_0']['flags'] = int(q.pop(4), 2)
-        data['payload']['tracking_v1_0']['timeslot'] = int(q.pop(4), 2)
-        data['payload']['tracking_v1_0']['longitude'] = int(q.pop(22), 2)
-        data['payload']['tracking_v1_0']['latitude'] = int(q.pop(21), 2)
-        data['payload']['tracking_v1_0']['orientation'] = int(q.pop(3), 2)
-        data['payload']['tracking_v1_0']['activity'] = int(q.pop(8), 2)
-        data['payload']['tracking_v1_0']['battery'] = int(q.pop(5), 2)
-        data['payload']['tracking_v1_0']['temp_min'] = int(q.pop(6), 2)
-        data['payload']['tracking_v1_0']['temp_max'] = int(q.pop(6), 2)
-        data['payload']['tracking_v1_0']['temp_alert'] = int(q.pop(1), 2)
+        data['payload']['tracking_v1_0']['flags'] = q.pop_int(4)
+        data['payload']['tracking_v1_0']['timeslot'] = q.pop_int(4)
+        data['payload']['tracking_v1_0']['longitude'] = q.pop_int(22)
+        data['payload']['tracking_v1_0']['latitude'] = q.pop_int(21)
+        data['payload']['tracking_v1_0']['orientation'] = q.pop_int(3)
+        data['payload']['tracking_v1_0']['activity'] = q.pop_int(8)
+        data['payload']['tracking_v1_0']['battery'] = q.pop_int(5)
+        data['payload']['tracking_v1_0']['temp_min'] = q.pop_int(6)
+        data['payload']['tracking_v1_0']['temp_max'] = q.pop_int(6)
+        data['payload']['tracking_v1_0']['temp_alert'] = q.pop_int(1)
         data['payload']['tracking_v1_0']['points'] = [OrderedDict(), OrderedDict(), OrderedDict()]
-        data['payload']['tracking_v1_0']['points'][0]['delta_km'] = int(q.pop(6), 2)
-        data['payload']['tracking_v1_0']['points'][0]['delta_m'] = int(q.pop(7), 2)
-        data['payload']['tracking_v1_0']['points'][0]['delta_angle'] = int(q.pop(11), 2)
-        data['payload']['tracking_v1_0']['points'][0]['activity'] = int(q.pop(8), 2)
-        data['payload']['tracking_v1_0']['points'][0]['temp_alert'] = int(q.pop(1), 2)
-        data['payload']['tracking_v1_0']['points'][1]['delta_km'] = int(q.pop(6), 2)
-        data['payload']['tracking_v1_0']['points'][1]['delta_m'] = int(q.pop(7), 2)
-        data['payload']['tracking_v1_0']['points'][1]['delta_angle'] = int(q.pop(11), 2)
-        data['payload']['tracking_v1_0']['points'][1]['activity'] = int(q.pop(8), 2)
-        data['payload']['tracking_v1_0']['points'][1]['temp_alert'] = int(q.pop(1), 2)
-        data['payload']['tracking_v1_0']['points'][2]['delta_km'] = int(q.pop(6), 2)
-        data['payload']['tracking_v1_0']['points'][2]['delta_m'] = int(q.pop(7), 2)
-        data['payload']['tracking_v1_0']['points'][2]['delta_angle'] = int(q.pop(11), 2)
-        data['payload']['tracking_v1_0']['points'][2]['activity'] = int(q.pop(8), 2)
-        data['payload']['tracking_v1_0']['points'][2]['temp_alert'] = int(q.pop(1), 2)
+        data['payload']['tracking_v1_0']['points'][0]['delta_km'] = q.pop_int(6)
+        data['payload']['tracking_v1_0']['points'][0]['delta_m'] = q.pop_int(7)
+        data['payload']['tracking_v1_0']['points'][0]['delta_angle'] = q.pop_int(11)
+        data['payload']['tracking_v1_0']['points'][0]['activity'] = q.pop_int(8)
+        data['payload']['tracking_v1_0']['points'][0]['temp_alert'] = q.pop_int(1)
+        data['payload']['tracking_v1_0']['points'][1]['delta_km'] = q.pop_int(6)
+        data['payload']['tracking_v1_0']['points'][1]['delta_m'] = q.pop_int(7)
+        data['payload']['tracking_v1_0']['points'][1]['delta_angle'] = q.pop_int(11)
+        data['payload']['tracking_v1_0']['points'][1]['activity'] = q.pop_int(8)
+        data['payload']['tracking_v1_0']['points'][1]['temp_alert'] = q.pop_int(1)
+        data['payload']['tracking_v1_0']['points'][2]['delta_km'] = q.pop_int(6)
+        data['payload']['tracking_v1_0']['points'][2]['delta_m'] = q.pop_int(7)
+        data['payload']['tracking_v1_0']['points'][2]['delta_angle'] = q.pop_int(11)
+        data['payload']['tracking_v1_0']['points'][2]['activity'] = q.pop_int(8)
+        data['payload']['tracking_v1_0']['points'][2]['temp_alert'] = q.pop_int(1)
     if data['packet_type'] == SCM_DF_Transmission_Payload.SCM_DF_Transmission_Payload_Tracking_v2_0:
         data['payload']['tracking_v2_0'] = OrderedDict()
-        data['payload']['tracking_v2_0']['days_since_epoch'] = int(q.pop(12), 2)
-        data['payload']['tracking_v2_0']['timeslot'] = int(q.pop(4), 2)
-        data['payload']['tracking_v2_0']['longitude'] = int(q.pop(24), 2)
-        data['payload']['tracking_v2_0']['latitude'] = int(q.pop(23), 2)
-        data['payload']['tracking_v2_0']['orientation'] = int(q.pop(3), 2)
-        data['payload']['tracking_v2_0']['activity'] = int(q.pop(8), 2)
-        data['payload']['tracking_v2_0']['battery'] = int(q.pop(5), 2)
-        data['payload']['tracking_v2_0']['temp_min'] = int(q.pop(6), 2)
-        data['payload']['tracking_v2_0']['temp_max'] = int(q.pop(6), 2)
-        data['payload']['tracking_v2_0']['temp_alert'] = int(q.pop(1), 2)
+        data['payload']['tracking_v2_0']['days_since_epoch'] = q.pop_int(12)
+        data['payload']['tracking_v2_0']['timeslot'] = q.pop_int(4)
+        data['payload']['tracking_v2_0']['longitude'] = q.pop_int(24)
+        data['payload']['tracking_v2_0']['latitude'] = q.pop_int(23)
+        data['payload']['tracking_v2_0']['orientation'] = q.pop_int(3)
+        data['payload']['tracking_v2_0']['activity'] = q.pop_int(8)
+        data['payload']['tracking_v2_0']['battery'] = q.pop_int(5)
+        data['payload']['tracking_v2_0']['temp_min'] = q.pop_int(6)
+        data['payload']['tracking_v2_0']['temp_max'] = q.pop_int(6)
+        data['payload']['tracking_v2_0']['temp_alert'] = q.pop_int(1)
         data['payload']['tracking_v2_0']['points'] = [OrderedDict(), OrderedDict()]
-        data['payload']['tracking_v2_0']['points'][0]['valid'] = int(q.pop(1), 2)
-        data['payload']['tracking_v2_0']['points'][0]['day_offset'] = int(q.pop(4), 2)
-        data['payload']['tracking_v2_0']['points'][0]['timeslot'] = int(q.pop(4), 2)
-        data['payload']['tracking_v2_0']['points'][0]['delta_km'] = int(q.pop(6), 2)
-        data['payload']['tracking_v2_0']['points'][0]['delta_m'] = int(q.pop(7), 2)
-        data['payload']['tracking_v2_0']['points'][0]['delta_angle'] = int(q.pop(11), 2)
-        data['payload']['tracking_v2_0']['points'][0]['activity'] = int(q.pop(8), 2)
-        data['payload']['tracking_v2_0']['points'][0]['temp_alert'] = int(q.pop(1), 2)
-        data['payload']['tracking_v2_0']['points'][1]['valid'] = int(q.pop(1), 2)
-        data['payload']['tracking_v2_0']['points'][1]['day_offset'] = int(q.pop(4), 2)
-        data['payload']['tracking_v2_0']['points'][1]['timeslot'] = int(q.pop(4), 2)
-        data['payload']['tracking_v2_0']['points'][1]['delta_km'] = int(q.pop(6), 2)
-        data['payload']['tracking_v2_0']['points'][1]['delta_m'] = int(q.pop(7), 2)
-        data['payload']['tracking_v2_0']['points'][1]['delta_angle'] = int(q.pop(11), 2)
-        data['payload']['tracking_v2_0']['points'][1]['activity'] = int(q.pop(8), 2)
-        data['payload']['tracking_v2_0']['points'][1]['temp_alert'] = int(q.pop(1), 2)
-        data['payload']['tracking_v2_0']['padding_0'] = int(q.pop(3), 2)
+        data['payload']['tracking_v2_0']['points'][0]['valid'] = q.pop_int(1)
+        data['payload']['tracking_v2_0']['points'][0]['day_offset'] = q.pop_int(4)
+        data['payload']['tracking_v2_0']['points'][0]['timeslot'] = q.pop_int(4)
+        data['payload']['tracking_v2_0']['points'][0]['delta_km'] = q.pop_int(6)
+        data['payload']['tracking_v2_0']['points'][0]['delta_m'] = q.pop_int(7)
+        data['payload']['tracking_v2_0']['points'][0]['delta_angle'] = q.pop_int(11)
+        data['payload']['tracking_v2_0']['points'][0]['activity'] = q.pop_int(8)
+        data['payload']['tracking_v2_0']['points'][0]['temp_alert'] = q.pop_int(1)
+        data['payload']['tracking_v2_0']['points'][1]['valid'] = q.pop_int(1)
+        data['payload']['tracking_v2_0']['points'][1]['day_offset'] = q.pop_int(4)
+        data['payload']['tracking_v2_0']['points'][1]['timeslot'] = q.pop_int(4)
+        data['payload']['tracking_v2_0']['points'][1]['delta_km'] = q.pop_int(6)
+        data['payload']['tracking_v2_0']['points'][1]['delta_m'] = q.pop_int(7)
+        data['payload']['tracking_v2_0']['points'][1]['delta_angle'] = q.pop_int(11)
+        data['payload']['tracking_v2_0']['points'][1]['activity'] = q.pop_int(8)
+        data['payload']['tracking_v2_0']['points'][1]['temp_alert'] = q.pop_int(1)
+        data['payload']['tracking_v2_0']['padding_0'] = q.pop_int(3)
     if data['packet_type'] == SCM_DF_Transmission_Payload.SCM_DF_Transmission_Payload_Status_v1_0:
         data['payload']['status_v1_0'] = OrderedDict()
-        data['payload']['status_v1_0']['timestamp'] = int(q.pop(32), 2)
-        data['payload']['status_v1_0']['epoch'] = int(q.pop(32), 2)
-        data['payload']['status_v1_0']['mode'] = int(q.pop(5), 2)
-        data['payload']['status_v1_0']['timezone_offset_m'] = int(q.pop(16), 2)
-        data['payload']['status_v1_0']['padding_0'] = int(q.pop(94), 2)
-    data['bch32'] = int(q.pop(32), 2)
+        data['payload']['status_v1_0']['timestamp'] = q.pop_int(32)
+        data['payload']['status_v1_0']['epoch'] = q.pop_int(32)
+        data['payload']['status_v1_0']['mode'] = q.pop_int(5)
+        data['payload']['status_v1_0']['timezone_offset_m'] = q.pop_int(16)
+        data['payload']['status_v1_0']['padding_0'] = q.pop_int(94)
+    data['bch32'] = q.pop_int(32)
     if q.size() != 0: raise DecodeError('Not all data decoded. {} bits remaining'.format(q.size()))
     return data
 
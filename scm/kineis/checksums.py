@@ -23,54 +23,166 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from crc import Calculator, Configuration
+from functools import lru_cache
 
 CRC16_POLYNOMIAL = 0x1021
 BCH32_POLYNOMIAL = 0xEE5B42FD
 FCS32_POLYNOMIAL = 0x04C11DB7
 
 
+def build_crc_table(polynomial, width):
+    """
+    build_crc_table precomputes the 256-entry lookup table for the given CRC polynomial,
+    allowing the checksum functions below to process a byte per table lookup instead of
+    running the shift-register update bit by bit.
+    :param polynomial: The CRC polynomial (without the leading term)
+    :param width: The width of the CRC in bits (16 or 32)
+    :return: A tuple of 256 precomputed CRC values
+    """
+    mask = (1 << width) - 1
+    top_bit = 1 << (width - 1)
+    table = []
+    for index in range(256):
+        crc = index << (width - 8)
+        for _ in range(8):
+            if crc & top_bit:
+                crc = ((crc << 1) ^ polynomial) & mask
+            else:
+                crc = (crc << 1) & mask
+        table.append(crc)
+    return tuple(table)
+
+
+def build_crc32_slice8_tables(byte_table):
+    """
+    build_crc32_slice8_tables extends a 32-bit byte-at-a-time table into the eight tables
+    used by the slice-by-8 technique, which folds eight input bytes per loop iteration
+    with eight parallel table lookups.
+    :param byte_table: The 256-entry byte-at-a-time table for the polynomial
+    :return: A tuple of eight 256-entry tables, tables[0] being byte_table
+    """
+    tables = [byte_table]
+    for _ in range(7):
+        previous = tables[-1]
+        tables.append(tuple(
+            byte_table[value >> 24] ^ ((value << 8) & 0xFFFFFFFF) for value in previous
+        ))
+    return tuple(tables)
+
+
+CRC16_TABLE = build_crc_table(CRC16_POLYNOMIAL, 16)
+BCH32_TABLE = build_crc_table(BCH32_POLYNOMIAL, 32)
+FCS32_TABLE = build_crc_table(FCS32_POLYNOMIAL, 32)
+BCH32_SLICE8_TABLES = build_crc32_slice8_tables(BCH32_TABLE)
+FCS32_SLICE8_TABLES = build_crc32_slice8_tables(FCS32_TABLE)
+
+
+def _crc32_slice8(data, tables):
+    """
+    _crc32_slice8 computes a 32-bit CRC using the slice-by-8 tables, consuming eight bytes
+    per iteration and finishing any remainder with the byte-at-a-time table.
+    :param data: The bytes to checksum
+    :param tables: The eight slice-by-8 tables for the polynomial
+    :return: The CRC as an int
+    """
+    t0, t1, t2, t3, t4, t5, t6, t7 = tables
+    crc = 0
+    length = len(data)
+    index = 0
+    while index + 8 <= length:
+        crc = (t7[data[index] ^ (crc >> 24)] ^
+               t6[data[index + 1] ^ ((crc >> 16) & 0xFF)] ^
+               t5[data[index + 2] ^ ((crc >> 8) & 0xFF)] ^
+               t4[data[index + 3] ^ (crc & 0xFF)] ^
+               t3[data[index + 4]] ^
+               t2[data[index + 5]] ^
+               t1[data[index + 6]] ^
+               t0[data[index + 7]])
+        index += 8
+    for byte in data[index:]:
+        crc = t0[(crc >> 24) ^ byte] ^ ((crc << 8) & 0xFFFFFFFF)
+    return crc
+
+
+def crc16(data):
+    """
+    crc16 computes the 16-bit CRC (polynomial 0x1021, init 0, no reflection) placed at the
+    beginning of the ARGOS transmission data packet.
+    :param data: The bytes to checksum
+    :return: The CRC16 as an int
+    """
+    crc = 0
+    table = CRC16_TABLE
+    for byte in data:
+        crc = table[(crc >> 8) ^ byte] ^ ((crc << 8) & 0xFFFF)
+    return crc
+
+
+def bch32(data):
+    """
+    bch32 computes the 32-bit BCH error correction code (polynomial 0xEE5B42FD, init 0,
+    no reflection) placed at the end of an ARGOS transmission data packet.
+    :param data: The bytes to checksum
+    :return: The BCH32 as an int
+    """
+    return _crc32_slice8(data, BCH32_SLICE8_TABLES)
+
+
+def fcs32(data):
+    """
+    fcs32 computes the 32-bit FCS (polynomial 0x04C11DB7, init 0, no reflection).
+    :param data: The bytes to checksum
+    :return: The FCS32 as an int
+    """
+    return _crc32_slice8(data, FCS32_SLICE8_TABLES)
+
+
+def bch32_batch(buffers):
+    """
+    bch32_batch computes the BCH32 for each buffer in an iterable, for bulk validation
+    of backfilled packets without the per-call wrapper overhead.
+    :param buffers: An iterable of bytes objects
+    :return: A list of BCH32 values, one per buffer
+    """
+    tables = BCH32_SLICE8_TABLES
+    return [_crc32_slice8(buffer, tables) for buffer in buffers]
+
+
+class TableCalculator:
+    """
+    TableCalculator provides the subset of the crc library's Calculator API used by
+    SCM_Utils, backed by the table-driven checksum functions above.
+    """
+    def __init__(self, checksum_function):
+        self.checksum_function = checksum_function
+
+    def checksum(self, data):
+        return self.checksum_function(data)
+
+    def verify(self, data, expected):
+        return self.checksum_function(data) == expected
+
+
+@lru_cache(maxsize=None)
 def get_bch32_calculator():
     """
     get_bch32_calculator creates a 32-bit CRC calculator for computing the BCH32 error correction code placed
     at the end of an ARGOS transmission data packet.
     :return: The CRC calculator that can compute the BCH32
     """
-    config = Configuration(
-        width=32,
-        polynomial=BCH32_POLYNOMIAL,
-        init_value=0x00,
-        final_xor_value=0x00,
-        reverse_input=False,
-        reverse_output=False,
-    )
-    return Calculator(config)
+    return TableCalculator(bch32)
 
 
+@lru_cache(maxsize=None)
 def get_fcs32_calculator():
-    config = Configuration(
-        width=32,
-        polynomial=FCS32_POLYNOMIAL,
-        init_value=0x00,
-        final_xor_value=0x00,
-        reverse_input=False,
-        reverse_output=False,
-    )
-    return Calculator(config)
+    return TableCalculator(fcs32)
 
 
+@lru_cache(maxsize=None)
 def get_crc16_calculator():
     """
     get_crc16_calculator creates a 16-bit CRC calculator for computing the CRC16 checksum placed at the beginning
     of the ARGOS transmission data packet.
     :return: The CRC calculator that can compute the CRC16
     """
-    config = Configuration(
-        width=16,
-        polynomial=CRC16_POLYNOMIAL,
-        init_value=0x00,
-        final_xor_value=0x00,
-        reverse_input=False,
-        reverse_output=False,
-    )
-    return Calculator(config)
+    return TableCalculator(crc16)
@@ -69,3 +69,18 @@ class ThingsBoardProcessedExpert(KineisMessageHandler):
             bch32_ok=self.is_bch_ok(message),
             epoch_year=self.device_epoch.get_device_epoch(message[values_key][device_id_key]))
         return message
+
+    def decode_batch(self, messages):
+        """
+        decode_batch validates a batch of messages up front and decodes only the
+        survivors, so a backfill run does not pay the decode cost for corrupt
+        messages and does not abort on the first one.
+        :param messages: An iterable of ThingsBoard telemetry messages
+        :return: A list of (message, decoded) pairs for the messages that validated,
+                 in input order
+        """
+        results = []
+        for message in messages:
+            if self.validate_message(message):
+                results.append((message, self.decode_message(message)))
+        return results
@@ -25,10 +25,15 @@
 import datetime
 from decimal import Decimal
 from enum import Enum
-from json import JSONEncoder
+from json import JSONEncoder, dumps
 
 from scm.utils.constants import timestamp_format
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class TransmissionEncoder(JSONEncoder):
     def default(self, to_encode):
@@ -40,4 +45,54 @@ class TransmissionEncoder(JSONEncoder):
             return to_encode.strftime(timestamp_format)
         elif type(to_encode) == datetime.timezone:
             return to_encode.utcoffset(None).total_seconds()
-        return JSONEncoder.default(self, to_encode)
\ No newline at end of file
+        return JSONEncoder.default(self, to_encode)
+
+    @classmethod
+    def normalize(cls, to_normalize):
+        """
+        normalize converts to_normalize into the same plain structure that serializing
+        it with TransmissionEncoder and parsing the JSON back would produce, without
+        the round trip through the JSON tokenizer.
+        :param to_normalize: The object to normalize
+        :return: The object with Enum, Decimal, datetime and timezone values converted
+        """
+        if isinstance(to_normalize, dict):
+            return {key: cls.normalize(value) for key, value in to_normalize.items()}
+        if isinstance(to_normalize, (list, tuple)):
+            return [cls.normalize(item) for item in to_normalize]
+        if isinstance(to_normalize, Enum):
+            return to_normalize.value
+        if isinstance(to_normalize, Decimal):
+            return str(to_normalize)
+        if type(to_normalize) == datetime.datetime:
+            return to_normalize.strftime(timestamp_format)
+        if type(to_normalize) == datetime.timezone:
+            return to_normalize.utcoffset(None).total_seconds()
+        return to_normalize
+
+
+def _transmission_default(to_encode):
+    if isinstance(to_encode, Enum):
+        return to_encode.value
+    if isinstance(to_encode, Decimal):
+        return str(to_encode)
+    if type(to_encode) == datetime.datetime:
+        return to_encode.strftime(timestamp_format)
+    if type(to_encode) == datetime.timezone:
+        return to_encode.utcoffset(None).total_seconds()
+    raise TypeError("Object of type {} is not JSON serializable".format(type(to_encode).__name__))
+
+
+def transmission_dumps(message):
+    """
+    transmission_dumps serializes a decoded message to JSON with the same conversions as
+    TransmissionEncoder, going through orjson when it is installed and falling back to
+    the standard library encoder otherwise.
+    :param message: The decoded message to serialize
+    :return: The JSON document as a str
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            message, default=_transmission_default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME).decode("utf-8")
+    return dumps(message, cls=TransmissionEncoder)
@@ -22,6 +22,10 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 
+from functools import lru_cache
+
+
 class DeviceEpoch:
+    @lru_cache(maxsize=1024)
     def get_device_epoch(self, device_id):
         return 2023
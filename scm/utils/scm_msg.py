@@ -22,17 +22,11 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 import math
-import struct
 from copy import deepcopy
 import datetime
 from decimal import Decimal
 from functools import lru_cache
-from collections import OrderedDict
-
-import tzlocal
-# from geographiclib.geodesic import Geodesic
-from geopy import Point
-from geopy.distance import great_circle
+from math import asin, atan2, cos, degrees, fmod, radians, sin
 
 from scm.generated.SCM_DF import *
 from scm.kineis.checksums import get_crc16_calculator, get_bch32_calculator
@@ -41,6 +35,94 @@ from scm.utils.constants import *
 from scm.utils.scm_epoch import DeviceEpoch
 
 
+# Decimal constants used on every decode, built once rather than per field/point.
+GPS_MULTIPLIER = Decimal(SCM_DF_GPS_MULTIPLIER)
+ONE_THOUSAND = Decimal(1000)
+
+# The checksum calculators are stateless; resolve them once at import rather than
+# per validated message.
+_CRC16_CALCULATOR = get_crc16_calculator()
+_BCH32_CALCULATOR = get_bch32_calculator()
+
+# Byte offsets of the checksum input slices within an encoded message.
+_CRC16_MESSAGE_START = math.ceil(SCM_DF_TRANSMISSION_ID_SIZE / 8)
+_BCH32_MESSAGE_END = SCM_DF_BUF_SIZE - SCM_DF_TRANSMISSION_BCH32_SIZE // 8
+
+# Header and trailer keys copied verbatim from the unpacked message into the result.
+_HEADER_KEYS = (transmission_id, transmission_crc16, transmission_SF, transmission_MC, transmission_packet_type)
+_TRAILER_KEYS = (transmission_bch32, transmission_crc16_verified, transmission_bch32_verified)
+
+
+# Quantization step sizes are fixed by the data format; compute them once at import.
+V1_0_BATTERY_STEP = (SCM_DF_BAT_RANGE_HIGH - SCM_DF_BAT_RANGE_LOW) / (2 ** SCM_DF_TRACKING_V1_0_BATTERY_SIZE)
+V1_0_TEMP_MAX_STEP = (SCM_DF_TEMP_MAX_HIGH - SCM_DF_TEMP_MAX_LOW) / (2 ** SCM_DF_TRACKING_V1_0_TEMP_MAX_SIZE)
+V1_0_TEMP_MIN_STEP = (SCM_DF_TEMP_MIN_HIGH - SCM_DF_TEMP_MIN_LOW) / (2 ** SCM_DF_TRACKING_V1_0_TEMP_MIN_SIZE)
+V1_0_POINT_DELTA_M_STEP = Decimal('1000') / (2 ** SCM_DF_POINT_V1_0_DELTA_M_SIZE)
+V1_0_POINT_BEARING_STEP = Decimal('360') / (2 ** SCM_DF_POINT_V1_0_DELTA_ANGLE_SIZE)
+V2_0_BATTERY_STEP = (SCM_DF_BAT_RANGE_HIGH - SCM_DF_BAT_RANGE_LOW) / (2 ** SCM_DF_TRACKING_V2_0_BATTERY_SIZE)
+V2_0_TEMP_MAX_STEP = (SCM_DF_TEMP_MAX_HIGH - SCM_DF_TEMP_MAX_LOW) / (2 ** SCM_DF_TRACKING_V2_0_TEMP_MAX_SIZE)
+V2_0_TEMP_MIN_STEP = (SCM_DF_TEMP_MIN_HIGH - SCM_DF_TEMP_MIN_LOW) / (2 ** SCM_DF_TRACKING_V2_0_TEMP_MIN_SIZE)
+V2_0_POINT_DELTA_M_STEP = Decimal('1000') / (2 ** SCM_DF_POINT_V1_0_DELTA_M_SIZE)
+V2_0_POINT_BEARING_STEP = Decimal('360') / (2 ** SCM_DF_POINT_V2_0_DELTA_ANGLE_SIZE)
+
+
+# The mean earth radius used by geopy's great_circle, kept so the inline destination
+# computation below produces results identical to the previous geopy-based one.
+GREAT_CIRCLE_EARTH_RADIUS_KM = 6371.009
+
+
+def great_circle_destination(latitude, longitude, bearing, distance_m):
+    """
+    great_circle_destination computes the point reached by travelling distance_m metres
+    from (latitude, longitude) along the given bearing on a great circle, using the same
+    spherical formula and earth radius as geopy.distance.great_circle.destination but
+    without constructing the intermediate Distance and Point objects.
+    :param latitude: The starting latitude in degrees
+    :param longitude: The starting longitude in degrees
+    :param bearing: The bearing in degrees
+    :param distance_m: The distance travelled in metres
+    :return: A (latitude, longitude) tuple in degrees, longitude normalized to [-180, 180)
+    """
+    lat1 = radians(latitude)
+    return _great_circle_destination(sin(lat1), cos(lat1), radians(longitude), bearing, distance_m)
+
+
+def _great_circle_destination(sin_lat1, cos_lat1, lng1, bearing, distance_m):
+    """
+    _great_circle_destination is the precomputed-trig form of great_circle_destination,
+    for loops where the start point is fixed and its sin/cos should only be taken once.
+    :param sin_lat1: sin of the starting latitude (in radians)
+    :param cos_lat1: cos of the starting latitude (in radians)
+    :param lng1: The starting longitude in radians
+    :param bearing: The bearing in degrees
+    :param distance_m: The distance travelled in metres
+    :return: A (latitude, longitude) tuple in degrees, longitude normalized to [-180, 180)
+    """
+    bearing_r = radians(bearing)
+
+    d_div_r = (distance_m / 1000.0) / GREAT_CIRCLE_EARTH_RADIUS_KM
+
+    sin_d = sin(d_div_r)
+    cos_d = cos(d_div_r)
+
+    lat2 = asin(
+        sin_lat1 * cos_d +
+        cos_lat1 * sin_d * cos(bearing_r)
+    )
+
+    lng2 = lng1 + atan2(
+        sin(bearing_r) * sin_d * cos_lat1,
+        cos_d - sin_lat1 * sin(lat2)
+    )
+
+    longitude_2 = fmod(degrees(lng2), 360.0) or 0.0
+    if longitude_2 < -180.0:
+        longitude_2 += 360.0
+    elif longitude_2 >= 180.0:
+        longitude_2 -= 360.0
+    return degrees(lat2), longitude_2
+
+
 class SCM_DF_Transmission_Status_v1_0_Mode(Enum):
     UNKNOOWN = 0
     Testing = 1
@@ -56,6 +138,27 @@ class SCM_DF_Transmission_Status_v1_0_Mode(Enum):
 class BCH32InvalidInputException(Exception): pass
 
 
+@lru_cache(maxsize=16)
+def _utc_epoch(year):
+    """
+    _utc_epoch returns (and caches) midnight January 1 of the given year in UTC.
+    :param year: The epoch year
+    :return: A timezone-aware datetime
+    """
+    return datetime.datetime(year, 1, 1, 0, 0, 0, tzinfo=datetime.timezone.utc)
+
+
+@lru_cache(maxsize=128)
+def _timezone_from_offset_minutes(offset_minutes):
+    """
+    _timezone_from_offset_minutes returns (and caches) the fixed-offset timezone for the
+    given offset in minutes.
+    :param offset_minutes: The UTC offset in minutes
+    :return: A datetime.timezone
+    """
+    return datetime.timezone(datetime.timedelta(seconds=offset_minutes * 60))
+
+
 def scm_is_bch32_ok(checked=None, bch_status=None):
     """
     scm_is_bch32_ok determines if the BCH32 checksum has matched properly
@@ -76,279 +179,353 @@ def scm_is_bch32_ok(checked=None, bch_status=None):
     return True
 
 
-def scm_raw_message_decode(raw_message, epoch_year):
+def scm_raw_message_decode(raw_message, epoch_year, validate_checksums=True):
     """
-    scm_message_decode decodes and converts the raw_message to an OrderedDict by calling scm.generated.scm_df_decode.
+    scm_message_decode decodes and converts the raw_message to a dict by calling scm.generated.scm_df_decode.
     scm_message_decode then converts the decoded quantized values into real world values.
 
-    :param raw_message: The raw message represented as a Hex encoded string.
+    :param raw_message: The raw message represented as a Hex encoded string or as bytes.
                         For example: "0EBAA003003845FA9FDB24001ACCC0123CF80006BD700002CDEA00F3BFF5B9"
-    :return: An OrderedDict containing the decoded and de-quantized data.
+    :param validate_checksums: When False, skip the re-encode and checksum verification;
+                               for callers that already hold authoritative verification
+                               flags and overwrite the verified fields themselves.
+    :return: A dict containing the decoded and de-quantized data.
     """
 
     ensure_message_length(raw_message)
+    if isinstance(raw_message, str):
+        raw_message = bytes.fromhex(raw_message)
     unpacked = scm_df_decode(raw_message)
-    scm_validate_checksums(unpacked)
-    result = OrderedDict()
+    if validate_checksums:
+        scm_validate_checksums(unpacked, raw_message)
+    else:
+        unpacked[transmission_crc16_verified] = False
+        unpacked[transmission_bch32_verified] = False
+    result = {}
 
     # Copy over the ID, CRC, DF, MC and packet_typpe
-    for key in [transmission_id, transmission_crc16, transmission_SF, transmission_MC, transmission_packet_type]:
+    for key in _HEADER_KEYS:
+        result[key] = unpacked[key]
+
+    # Decode the payload with the decoder specialized for this packet type.
+    payload_decoder = PACKET_TYPE_DECODERS.get(unpacked[transmission_packet_type])
+    if payload_decoder is not None:
+        payload_decoder(unpacked, result, epoch_year)
+
+    # Copy over the BCH32
+    for key in _TRAILER_KEYS:
         result[key] = unpacked[key]
 
-    # If this is a tracking packet, unpack it.
-    if unpacked[transmission_packet_type] == SCM_DF_Transmission_Payload.SCM_DF_Transmission_Payload_Tracking_v1_0:
-        result[transmission_payload] = OrderedDict()
-        result[transmission_payload][transmission_payload_tracking_v1_0] = OrderedDict()
-
-        tracking_payload = unpacked[transmission_payload][transmission_payload_tracking_v1_0]
-        result_tracking_payload = result[transmission_payload][transmission_payload_tracking_v1_0]
-
-        # Convert Flags
-        result_tracking_payload[transmission_payload_tracking_flags] = \
-            tracking_payload[transmission_payload_tracking_flags]
-
-        # Convert Timeslot
-        result_tracking_payload[transmission_payload_tracking_timeslot] = \
-            tracking_payload[transmission_payload_tracking_timeslot] * 2
-
-        # Convert Longitude
-        result_tracking_payload[transmission_payload_tracking_longitude] = \
-            unpack_signed_int_32(
-                tracking_payload[transmission_payload_tracking_longitude],
-                32 - SCM_DF_TRACKING_V1_0_LONGITUDE_SIZE
-            )[0]
-        focus_longitude = Decimal(result_tracking_payload[transmission_payload_tracking_longitude]) / Decimal(
-            SCM_DF_GPS_MULTIPLIER)
-        result_tracking_payload[transmission_payload_tracking_longitude] = focus_longitude
-
-        # Convert Latitude
-        result_tracking_payload[transmission_payload_tracking_latitude] = \
-            unpack_signed_int_32(
-                tracking_payload[transmission_payload_tracking_latitude],
-                32 - SCM_DF_TRACKING_V1_0_LATITUDE_SIZE
-            )[0]
-        focus_latitude = Decimal(result_tracking_payload[transmission_payload_tracking_latitude]) / Decimal(
-            SCM_DF_GPS_MULTIPLIER)
-        result_tracking_payload[transmission_payload_tracking_latitude] = focus_latitude
-
-        # Convert Orientation
-        result_tracking_payload[transmission_payload_tracking_orientation] = \
-            tracking_payload[transmission_payload_tracking_orientation]
-
-        # Convert Activity level
-        result_tracking_payload[transmission_payload_tracking_activity] = \
-            tracking_payload[transmission_payload_tracking_activity]
-
-        # Convert Battery voltage
-        result_tracking_payload[transmission_payload_tracking_battery] = \
-            (Decimal(tracking_payload[
-                         transmission_payload_tracking_battery]) * calculate_v1_0_battery_step()) + SCM_DF_BAT_RANGE_LOW
-
-        # Convert Temperature Min
-        result_tracking_payload[transmission_payload_tracking_temp_min] = \
-            (Decimal(tracking_payload[
-                         transmission_payload_tracking_temp_min]) * calculate_v1_0_temp_min_step()) + SCM_DF_TEMP_MIN_LOW
-
-        # Convert Temperature Max
-        result_tracking_payload[transmission_payload_tracking_temp_max] = \
-            (Decimal(tracking_payload[
-                         transmission_payload_tracking_temp_max]) * calculate_v1_0_temp_max_step()) + SCM_DF_TEMP_MAX_LOW
-
-        # Convert Temperature Alert
-        result_tracking_payload[transmission_payload_tracking_temp_alert] = \
-            tracking_payload[transmission_payload_tracking_temp_alert] == 1
-
-        # Convert the associated points
-        # geod = Geodesic.WGS84
-        result_tracking_payload[transmission_payload_tracking_points] = []
-        result_points = result_tracking_payload[transmission_payload_tracking_points]
-        for point in tracking_payload[transmission_payload_tracking_points]:
-            res = OrderedDict()
-            result_points.append(res)
-
-            # Compute Values
-            delta_d_km = point[transmission_payload_tracking_points_delta_km]
-            delta_d_m = Decimal(point[transmission_payload_tracking_points_delta_m]) * calculate_v1_0_point_delta_m_step()
-            total_delta_m = (delta_d_km * Decimal(1000)) + delta_d_m
-            bearing = Decimal(point[transmission_payload_tracking_points_delta_angle]) * calculate_v1_0_point_bearing_step()
-            activity = point[transmission_payload_tracking_points_activity]
-            temp_alert = point[transmission_payload_tracking_points_temp_alert] == 1
-
-            # Geodesy Direct Problem:
-            #  https://en.wikipedia.org/wiki/Geodesics_on_an_ellipsoid#Geodesics_on_an_ellipsoid_of_revolution
-            #
-            # From https://en.wikipedia.org/wiki/Geodesics_on_an_ellipsoid#Applications:
-            #   The direct and inverse geodesic problems no longer play the central role in geodesy that they once did.
-            #   Instead of solving adjustment of geodetic networks as a two-dimensional problem in spheroidal
-            #   trigonometry, these problems are now solved by three-dimensional methods
-            #   (Vincenty & Bowring 1978)[https://www.ngs.noaa.gov/PUBS_LIB/ApplicationOfThreeDimensionalGeodesyToAdjustmentsOfHorizontalNetworks_TM_NOS_NGS13.pdf].
-            # computed_position = geod.Direct(float(focus_latitude), float(focus_longitude), bearing, float(total_delta_m))
-
-            # TinyGPS library uses the great-circle distance computation:
-            # https://github.com/mikalhart/TinyGPS/blob/db4ef9c97af767e7345f5ccb277ac3bd1a2eb81f/TinyGPS.cpp#L296-L339
-            focus = Point(float(focus_latitude), float(focus_longitude))
-            computed_position = great_circle(meters=float(total_delta_m)).destination(focus, bearing)
-
-            # Populate results
-            res[transmission_payload_tracking_points_delta_km] = delta_d_km
-            res[transmission_payload_tracking_points_delta_m] = delta_d_m
-            res[transmission_payload_tracking_points_total_delta_m] = total_delta_m
-            res[transmission_payload_tracking_points_delta_angle] = bearing
-            res[transmission_payload_tracking_points_activity] = activity
-            res[transmission_payload_tracking_points_temp_alert] = temp_alert
-            res[transmission_payload_tracking_latitude] = computed_position.latitude  # computed_position['lat2']
-            res[transmission_payload_tracking_longitude] = computed_position.longitude  # computed_position['lon2']
-
-    elif unpacked[transmission_packet_type] == SCM_DF_Transmission_Payload.SCM_DF_Transmission_Payload_Tracking_v2_0:
-        result[transmission_payload] = OrderedDict()
-        result[transmission_payload][transmission_payload_tracking_v2_0] = OrderedDict()
-        result_tracking_v2_0_payload = result[transmission_payload][transmission_payload_tracking_v2_0]
-
-        tracking_v2_0_payload = unpacked[transmission_payload][transmission_payload_tracking_v2_0]
-
-        # Timestamp
-        result_tracking_v2_0_payload[transmission_payload_tracking_days_since_epoch] = \
-            tracking_v2_0_payload[transmission_payload_tracking_days_since_epoch]
-
-        # Convert Timeslot
-        result_tracking_v2_0_payload[transmission_payload_tracking_timeslot] = \
-            tracking_v2_0_payload[transmission_payload_tracking_timeslot] * 2
-
-        # Calculate timestamp
-        epoch = datetime.datetime(epoch_year, 1, 1, 0, 0, 0, tzinfo=datetime.timezone.utc)
-        v2_0_focus_ts = epoch + datetime.timedelta(days=result_tracking_v2_0_payload[transmission_payload_tracking_days_since_epoch], hours=result_tracking_v2_0_payload[transmission_payload_tracking_timeslot])
-        result_tracking_v2_0_payload[transmission_payload_tracking_timestamp] = v2_0_focus_ts
-
-        # Convert Longitude
-        result_tracking_v2_0_payload[transmission_payload_tracking_longitude] = \
-            unpack_signed_int_32(
-                tracking_v2_0_payload[transmission_payload_tracking_longitude],
-                32 - SCM_DF_TRACKING_V2_0_LONGITUDE_SIZE
-            )[0]
-        focus_longitude = Decimal(result_tracking_v2_0_payload[transmission_payload_tracking_longitude]) / Decimal(
-            SCM_DF_GPS_MULTIPLIER)
-        result_tracking_v2_0_payload[transmission_payload_tracking_longitude] = focus_longitude
-
-        # Convert Latitude
-        result_tracking_v2_0_payload[transmission_payload_tracking_latitude] = \
-            unpack_signed_int_32(
-                tracking_v2_0_payload[transmission_payload_tracking_latitude],
-                32 - SCM_DF_TRACKING_V2_0_LATITUDE_SIZE
-            )[0]
-        focus_latitude = Decimal(result_tracking_v2_0_payload[transmission_payload_tracking_latitude]) / Decimal(
-            SCM_DF_GPS_MULTIPLIER)
-        result_tracking_v2_0_payload[transmission_payload_tracking_latitude] = focus_latitude
-
-        # Convert Orientation
-        result_tracking_v2_0_payload[transmission_payload_tracking_orientation] = \
-            tracking_v2_0_payload[transmission_payload_tracking_orientation]
-
-        # Convert Activity level
-        result_tracking_v2_0_payload[transmission_payload_tracking_activity] = \
-            tracking_v2_0_payload[transmission_payload_tracking_activity]
-
-        # Convert Battery voltage
-        result_tracking_v2_0_payload[transmission_payload_tracking_battery] = \
-            (Decimal(tracking_v2_0_payload[
-                         transmission_payload_tracking_battery]) * calculate_v2_0_battery_step()) + SCM_DF_BAT_RANGE_LOW
-
-        # Convert Temperature Min
-        result_tracking_v2_0_payload[transmission_payload_tracking_temp_min] = \
-            (Decimal(tracking_v2_0_payload[
-                         transmission_payload_tracking_temp_min]) * calculate_v2_0_temp_min_step()) + SCM_DF_TEMP_MIN_LOW
-
-        # Convert Temperature Max
-        result_tracking_v2_0_payload[transmission_payload_tracking_temp_max] = \
-            (Decimal(tracking_v2_0_payload[
-                         transmission_payload_tracking_temp_max]) * calculate_v2_0_temp_max_step()) + SCM_DF_TEMP_MAX_LOW
-
-        # Convert Temperature Alert
-        result_tracking_v2_0_payload[transmission_payload_tracking_temp_alert] = \
-            tracking_v2_0_payload[transmission_payload_tracking_temp_alert] == 1
-
-        # Convert the associated points
-        # geod = Geodesic.WGS84
-        result_tracking_v2_0_payload[transmission_payload_tracking_points] = []
-        result_points = result_tracking_v2_0_payload[transmission_payload_tracking_points]
-        for point in tracking_v2_0_payload[transmission_payload_tracking_points]:
-            res = OrderedDict()
-            result_points.append(res)
-
-            res[transmission_payload_tracking_points_day_offset] = point[transmission_payload_tracking_points_day_offset]
-            res[transmission_payload_tracking_points_timeslot] = point[transmission_payload_tracking_points_timeslot] * 2
-            point_ts = v2_0_focus_ts - datetime.timedelta(days=point[transmission_payload_tracking_points_day_offset])
-            point_ts = point_ts.replace(hour=res[transmission_payload_tracking_points_timeslot])
-            res[transmission_payload_tracking_points_timestamp] = point_ts
-
-
-            # Compute Values
-            delta_d_km = point[transmission_payload_tracking_points_delta_km]
-            delta_d_m = Decimal(point[transmission_payload_tracking_points_delta_m]) * calculate_v2_0_point_delta_m_step()
-            total_delta_m = (delta_d_km * Decimal(1000)) + delta_d_m
-            bearing = Decimal(
-                point[transmission_payload_tracking_points_delta_angle]) * calculate_v2_0_point_bearing_step()
-            activity = point[transmission_payload_tracking_points_activity]
-            temp_alert = point[transmission_payload_tracking_points_temp_alert] == 1
-
-            # Geodesy Direct Problem:
-            #  https://en.wikipedia.org/wiki/Geodesics_on_an_ellipsoid#Geodesics_on_an_ellipsoid_of_revolution
-            #
-            # From https://en.wikipedia.org/wiki/Geodesics_on_an_ellipsoid#Applications:
-            #   The direct and inverse geodesic problems no longer play the central role in geodesy that they once did.
-            #   Instead of solving adjustment of geodetic networks as a two-dimensional problem in spheroidal
-            #   trigonometry, these problems are now solved by three-dimensional methods
-            #   (Vincenty & Bowring 1978)[https://www.ngs.noaa.gov/PUBS_LIB/ApplicationOfThreeDimensionalGeodesyToAdjustmentsOfHorizontalNetworks_TM_NOS_NGS13.pdf].
-            # computed_position = geod.Direct(float(focus_latitude), float(focus_longitude), bearing, float(total_delta_m))
-
-            # TinyGPS library uses the great-circle distance computation:
-            # https://github.com/mikalhart/TinyGPS/blob/db4ef9c97af767e7345f5ccb277ac3bd1a2eb81f/TinyGPS.cpp#L296-L339
-            focus = Point(float(focus_latitude), float(focus_longitude))
-            computed_position = great_circle(meters=float(total_delta_m)).destination(focus, bearing)
-
-            # Populate results
-            res[transmission_payload_tracking_points_delta_km] = delta_d_km
-            res[transmission_payload_tracking_points_delta_m] = delta_d_m
-            res[transmission_payload_tracking_points_total_delta_m] = total_delta_m
-            res[transmission_payload_tracking_points_delta_angle] = bearing
-            res[transmission_payload_tracking_points_activity] = activity
-            res[transmission_payload_tracking_points_temp_alert] = temp_alert
-            res[transmission_payload_tracking_latitude] = computed_position.latitude  # computed_position['lat2']
-            res[transmission_payload_tracking_longitude] = computed_position.longitude  # computed_position['lon2']
-
-
-    elif unpacked[transmission_packet_type] == SCM_DF_Transmission_Payload.SCM_DF_Transmission_Payload_Status_v1_0:
-        result[transmission_payload] = OrderedDict()
-        result[transmission_payload][transmission_payload_status_v1_0] = OrderedDict()
-        unpacked_status = unpacked[transmission_payload][transmission_payload_status_v1_0]
-        status = result[transmission_payload][transmission_payload_status_v1_0]
-
-        tz = datetime.timezone(
-            datetime.timedelta(seconds=unpacked_status[transmission_payload_status_timezone_offset_m] * 60))
-
-        status[transmission_payload_status_timestamp] = datetime.datetime.fromtimestamp(unpacked_status[transmission_payload_status_timestamp], tz)
-
-        status[transmission_payload_status_epoch] = datetime.datetime(
-            unpacked_status[transmission_payload_status_epoch], 1, 1, 0, 0, 0, 0, datetime.timezone.utc)
-
-        status[transmission_payload_status_mode] = SCM_DF_Transmission_Status_v1_0_Mode(
-            unpacked_status[transmission_payload_status_mode])
-
-        status[transmission_payload_status_timezone] = tz
-        status[transmission_payload_status_timezone_offset_m] = unpacked_status[transmission_payload_status_timezone_offset_m]
+    result[transmission_decoded_type] = transmission_decoded_raw_type
 
+    return result
 
 
+def scm_raw_message_decode_many(raw_messages, epoch_year):
+    """
+    scm_raw_message_decode_many decodes an iterable of raw messages in one call, for
+    archive workloads where callers would otherwise dispatch into the decoder once per
+    message.
+    :param raw_messages: An iterable of raw messages (Hex encoded strings or bytes)
+    :param epoch_year: The epoch year to use when computing timestamps
+    :return: A list of decoded message dicts, in input order
+    """
+    decode = scm_raw_message_decode
+    return [decode(raw_message, epoch_year) for raw_message in raw_messages]
 
 
+@lru_cache(maxsize=4096)
+def _scm_raw_message_decode_cached(raw_message, epoch_year):
+    return scm_raw_message_decode(raw_message, epoch_year)
 
-    # Copy over the BCH32
-    for key in [transmission_bch32, transmission_crc16_verified, transmission_bch32_verified]:
-        result[key] = unpacked[key]
 
-    result[transmission_decoded_type] = transmission_decoded_raw_type
+def scm_raw_message_decode_cached(raw_message, epoch_year):
+    """
+    scm_raw_message_decode_cached is an opt-in caching wrapper around
+    scm_raw_message_decode for workloads that see the same raw message repeatedly
+    (retransmissions, replays, reprocessing runs). Results are cached per
+    (raw_message, epoch_year); each call returns a fresh copy so callers can mutate
+    the result without poisoning the cache.
+    :param raw_message: The raw message represented as a Hex encoded string or as bytes
+    :param epoch_year: The epoch year to use when computing timestamps
+    :return: A dict containing the decoded and de-quantized data
+    """
+    return deepcopy(_scm_raw_message_decode_cached(raw_message, epoch_year))
 
-    return result
 
+def decode_tracking_v1_0_payload(unpacked, result, epoch_year):
+    """
+    decode_tracking_v1_0_payload converts the quantized tracking_v1_0 payload fields in
+    unpacked into real world values and stores them under result[transmission_payload].
+    """
+    result[transmission_payload] = {}
+    result[transmission_payload][transmission_payload_tracking_v1_0] = {}
+
+    tracking_payload = unpacked[transmission_payload][transmission_payload_tracking_v1_0]
+    result_tracking_payload = result[transmission_payload][transmission_payload_tracking_v1_0]
+
+    # Convert Flags
+    result_tracking_payload[transmission_payload_tracking_flags] = \
+        tracking_payload[transmission_payload_tracking_flags]
+
+    # Convert Timeslot
+    result_tracking_payload[transmission_payload_tracking_timeslot] = \
+        tracking_payload[transmission_payload_tracking_timeslot] * 2
+
+    # Convert Longitude
+    focus_longitude = Decimal(unpack_signed_int_32(
+        tracking_payload[transmission_payload_tracking_longitude],
+        32 - SCM_DF_TRACKING_V1_0_LONGITUDE_SIZE
+    )[0]) / GPS_MULTIPLIER
+    result_tracking_payload[transmission_payload_tracking_longitude] = focus_longitude
+
+    # Convert Latitude
+    focus_latitude = Decimal(unpack_signed_int_32(
+        tracking_payload[transmission_payload_tracking_latitude],
+        32 - SCM_DF_TRACKING_V1_0_LATITUDE_SIZE
+    )[0]) / GPS_MULTIPLIER
+    result_tracking_payload[transmission_payload_tracking_latitude] = focus_latitude
+
+    # Convert Orientation
+    result_tracking_payload[transmission_payload_tracking_orientation] = \
+        tracking_payload[transmission_payload_tracking_orientation]
+
+    # Convert Activity level
+    result_tracking_payload[transmission_payload_tracking_activity] = \
+        tracking_payload[transmission_payload_tracking_activity]
+
+    # Convert Battery voltage
+    result_tracking_payload[transmission_payload_tracking_battery] = \
+        (Decimal(tracking_payload[
+                     transmission_payload_tracking_battery]) * V1_0_BATTERY_STEP) + SCM_DF_BAT_RANGE_LOW
+
+    # Convert Temperature Min
+    result_tracking_payload[transmission_payload_tracking_temp_min] = \
+        (Decimal(tracking_payload[
+                     transmission_payload_tracking_temp_min]) * V1_0_TEMP_MIN_STEP) + SCM_DF_TEMP_MIN_LOW
+
+    # Convert Temperature Max
+    result_tracking_payload[transmission_payload_tracking_temp_max] = \
+        (Decimal(tracking_payload[
+                     transmission_payload_tracking_temp_max]) * V1_0_TEMP_MAX_STEP) + SCM_DF_TEMP_MAX_LOW
+
+    # Convert Temperature Alert
+    result_tracking_payload[transmission_payload_tracking_temp_alert] = \
+        tracking_payload[transmission_payload_tracking_temp_alert] == 1
+
+    # Convert the associated points
+    # geod = Geodesic.WGS84
+    result_tracking_payload[transmission_payload_tracking_points] = []
+    result_points = result_tracking_payload[transmission_payload_tracking_points]
+    # The focus coordinates and quantization steps are shared by every point in
+    # the packet; take the focus trig terms (and bind the append method) once
+    # before the loop.
+    focus_lat1 = radians(float(focus_latitude))
+    focus_sin_lat1 = sin(focus_lat1)
+    focus_cos_lat1 = cos(focus_lat1)
+    focus_lng1 = radians(float(focus_longitude))
+    append_point = result_points.append
+    point_delta_m_step = V1_0_POINT_DELTA_M_STEP
+    point_bearing_step = V1_0_POINT_BEARING_STEP
+    for point in tracking_payload[transmission_payload_tracking_points]:
+        # Compute Values
+        delta_d_km = point[transmission_payload_tracking_points_delta_km]
+        delta_d_m = Decimal(point[transmission_payload_tracking_points_delta_m]) * point_delta_m_step
+        total_delta_m = (delta_d_km * ONE_THOUSAND) + delta_d_m
+        bearing = Decimal(point[transmission_payload_tracking_points_delta_angle]) * point_bearing_step
+        activity = point[transmission_payload_tracking_points_activity]
+        temp_alert = point[transmission_payload_tracking_points_temp_alert] == 1
+
+        # Geodesy Direct Problem:
+        #  https://en.wikipedia.org/wiki/Geodesics_on_an_ellipsoid#Geodesics_on_an_ellipsoid_of_revolution
+        #
+        # From https://en.wikipedia.org/wiki/Geodesics_on_an_ellipsoid#Applications:
+        #   The direct and inverse geodesic problems no longer play the central role in geodesy that they once did.
+        #   Instead of solving adjustment of geodetic networks as a two-dimensional problem in spheroidal
+        #   trigonometry, these problems are now solved by three-dimensional methods
+        #   (Vincenty & Bowring 1978)[https://www.ngs.noaa.gov/PUBS_LIB/ApplicationOfThreeDimensionalGeodesyToAdjustmentsOfHorizontalNetworks_TM_NOS_NGS13.pdf].
+        # computed_position = geod.Direct(float(focus_latitude), float(focus_longitude), bearing, float(total_delta_m))
+
+        # TinyGPS library uses the great-circle distance computation:
+        # https://github.com/mikalhart/TinyGPS/blob/db4ef9c97af767e7345f5ccb277ac3bd1a2eb81f/TinyGPS.cpp#L296-L339
+        computed_latitude, computed_longitude = _great_circle_destination(
+            focus_sin_lat1, focus_cos_lat1, focus_lng1, bearing, float(total_delta_m))
+
+        # Populate results in one dict literal instead of eight separate inserts.
+        append_point({
+            transmission_payload_tracking_points_delta_km: delta_d_km,
+            transmission_payload_tracking_points_delta_m: delta_d_m,
+            transmission_payload_tracking_points_total_delta_m: total_delta_m,
+            transmission_payload_tracking_points_delta_angle: bearing,
+            transmission_payload_tracking_points_activity: activity,
+            transmission_payload_tracking_points_temp_alert: temp_alert,
+            transmission_payload_tracking_latitude: computed_latitude,  # computed_position['lat2']
+            transmission_payload_tracking_longitude: computed_longitude,  # computed_position['lon2']
+        })
+
+
+def decode_tracking_v2_0_payload(unpacked, result, epoch_year):
+    """
+    decode_tracking_v2_0_payload converts the quantized tracking_v2_0 payload fields in
+    unpacked into real world values and stores them under result[transmission_payload].
+    """
+    result[transmission_payload] = {}
+    result[transmission_payload][transmission_payload_tracking_v2_0] = {}
+    result_tracking_v2_0_payload = result[transmission_payload][transmission_payload_tracking_v2_0]
+
+    tracking_v2_0_payload = unpacked[transmission_payload][transmission_payload_tracking_v2_0]
+
+    # Timestamp
+    result_tracking_v2_0_payload[transmission_payload_tracking_days_since_epoch] = \
+        tracking_v2_0_payload[transmission_payload_tracking_days_since_epoch]
+
+    # Convert Timeslot
+    result_tracking_v2_0_payload[transmission_payload_tracking_timeslot] = \
+        tracking_v2_0_payload[transmission_payload_tracking_timeslot] * 2
+
+    # Calculate timestamp
+    epoch = _utc_epoch(epoch_year)
+    v2_0_focus_ts = epoch + datetime.timedelta(days=result_tracking_v2_0_payload[transmission_payload_tracking_days_since_epoch], hours=result_tracking_v2_0_payload[transmission_payload_tracking_timeslot])
+    result_tracking_v2_0_payload[transmission_payload_tracking_timestamp] = v2_0_focus_ts
+
+    # Every point timestamp is midnight of the focus day minus a day offset plus its
+    # timeslot hour; precompute the focus day's midnight as epoch seconds so each point
+    # costs one datetime construction instead of a timedelta subtraction plus replace().
+    focus_ts_seconds = int(v2_0_focus_ts.timestamp())
+    focus_day_start_seconds = focus_ts_seconds - (focus_ts_seconds % 86400)
+
+    # Convert Longitude
+    focus_longitude = Decimal(unpack_signed_int_32(
+        tracking_v2_0_payload[transmission_payload_tracking_longitude],
+        32 - SCM_DF_TRACKING_V2_0_LONGITUDE_SIZE
+    )[0]) / GPS_MULTIPLIER
+    result_tracking_v2_0_payload[transmission_payload_tracking_longitude] = focus_longitude
+
+    # Convert Latitude
+    focus_latitude = Decimal(unpack_signed_int_32(
+        tracking_v2_0_payload[transmission_payload_tracking_latitude],
+        32 - SCM_DF_TRACKING_V2_0_LATITUDE_SIZE
+    )[0]) / GPS_MULTIPLIER
+    result_tracking_v2_0_payload[transmission_payload_tracking_latitude] = focus_latitude
+
+    # Convert Orientation
+    result_tracking_v2_0_payload[transmission_payload_tracking_orientation] = \
+        tracking_v2_0_payload[transmission_payload_tracking_orientation]
+
+    # Convert Activity level
+    result_tracking_v2_0_payload[transmission_payload_tracking_activity] = \
+        tracking_v2_0_payload[transmission_payload_tracking_activity]
+
+    # Convert Battery voltage
+    result_tracking_v2_0_payload[transmission_payload_tracking_battery] = \
+        (Decimal(tracking_v2_0_payload[
+                     transmission_payload_tracking_battery]) * V2_0_BATTERY_STEP) + SCM_DF_BAT_RANGE_LOW
+
+    # Convert Temperature Min
+    result_tracking_v2_0_payload[transmission_payload_tracking_temp_min] = \
+        (Decimal(tracking_v2_0_payload[
+                     transmission_payload_tracking_temp_min]) * V2_0_TEMP_MIN_STEP) + SCM_DF_TEMP_MIN_LOW
+
+    # Convert Temperature Max
+    result_tracking_v2_0_payload[transmission_payload_tracking_temp_max] = \
+        (Decimal(tracking_v2_0_payload[
+                     transmission_payload_tracking_temp_max]) * V2_0_TEMP_MAX_STEP) + SCM_DF_TEMP_MAX_LOW
+
+    # Convert Temperature Alert
+    result_tracking_v2_0_payload[transmission_payload_tracking_temp_alert] = \
+        tracking_v2_0_payload[transmission_payload_tracking_temp_alert] == 1
+
+    # Convert the associated points
+    # geod = Geodesic.WGS84
+    result_tracking_v2_0_payload[transmission_payload_tracking_points] = []
+    result_points = result_tracking_v2_0_payload[transmission_payload_tracking_points]
+    # The focus coordinates and quantization steps are shared by every point in
+    # the packet; take the focus trig terms (and bind the append method) once
+    # before the loop.
+    focus_lat1 = radians(float(focus_latitude))
+    focus_sin_lat1 = sin(focus_lat1)
+    focus_cos_lat1 = cos(focus_lat1)
+    focus_lng1 = radians(float(focus_longitude))
+    append_point = result_points.append
+    point_delta_m_step = V2_0_POINT_DELTA_M_STEP
+    point_bearing_step = V2_0_POINT_BEARING_STEP
+    for point in tracking_v2_0_payload[transmission_payload_tracking_points]:
+        day_offset = point[transmission_payload_tracking_points_day_offset]
+        timeslot = point[transmission_payload_tracking_points_timeslot] * 2
+        point_ts = datetime.datetime.fromtimestamp(
+            focus_day_start_seconds - day_offset * 86400 + timeslot * 3600,
+            datetime.timezone.utc)
+
+        # Compute Values
+        delta_d_km = point[transmission_payload_tracking_points_delta_km]
+        delta_d_m = Decimal(point[transmission_payload_tracking_points_delta_m]) * point_delta_m_step
+        total_delta_m = (delta_d_km * ONE_THOUSAND) + delta_d_m
+        bearing = Decimal(
+            point[transmission_payload_tracking_points_delta_angle]) * point_bearing_step
+        activity = point[transmission_payload_tracking_points_activity]
+        temp_alert = point[transmission_payload_tracking_points_temp_alert] == 1
+
+        # Geodesy Direct Problem:
+        #  https://en.wikipedia.org/wiki/Geodesics_on_an_ellipsoid#Geodesics_on_an_ellipsoid_of_revolution
+        #
+        # From https://en.wikipedia.org/wiki/Geodesics_on_an_ellipsoid#Applications:
+        #   The direct and inverse geodesic problems no longer play the central role in geodesy that they once did.
+        #   Instead of solving adjustment of geodetic networks as a two-dimensional problem in spheroidal
+        #   trigonometry, these problems are now solved by three-dimensional methods
+        #   (Vincenty & Bowring 1978)[https://www.ngs.noaa.gov/PUBS_LIB/ApplicationOfThreeDimensionalGeodesyToAdjustmentsOfHorizontalNetworks_TM_NOS_NGS13.pdf].
+        # computed_position = geod.Direct(float(focus_latitude), float(focus_longitude), bearing, float(total_delta_m))
+
+        # TinyGPS library uses the great-circle distance computation:
+        # https://github.com/mikalhart/TinyGPS/blob/db4ef9c97af767e7345f5ccb277ac3bd1a2eb81f/TinyGPS.cpp#L296-L339
+        computed_latitude, computed_longitude = _great_circle_destination(
+            focus_sin_lat1, focus_cos_lat1, focus_lng1, bearing, float(total_delta_m))
+
+        # Populate results in one dict literal instead of eleven separate inserts.
+        append_point({
+            transmission_payload_tracking_points_day_offset: day_offset,
+            transmission_payload_tracking_points_timeslot: timeslot,
+            transmission_payload_tracking_points_timestamp: point_ts,
+            transmission_payload_tracking_points_delta_km: delta_d_km,
+            transmission_payload_tracking_points_delta_m: delta_d_m,
+            transmission_payload_tracking_points_total_delta_m: total_delta_m,
+            transmission_payload_tracking_points_delta_angle: bearing,
+            transmission_payload_tracking_points_activity: activity,
+            transmission_payload_tracking_points_temp_alert: temp_alert,
+            transmission_payload_tracking_latitude: computed_latitude,  # computed_position['lat2']
+            transmission_payload_tracking_longitude: computed_longitude,  # computed_position['lon2']
+        })
+
+
+def decode_status_v1_0_payload(unpacked, result, epoch_year):
+    """
+    decode_status_v1_0_payload converts the status_v1_0 payload fields in unpacked into
+    real world values and stores them under result[transmission_payload].
+    """
+    result[transmission_payload] = {}
+    result[transmission_payload][transmission_payload_status_v1_0] = {}
+    unpacked_status = unpacked[transmission_payload][transmission_payload_status_v1_0]
+    status = result[transmission_payload][transmission_payload_status_v1_0]
+
+    tz = _timezone_from_offset_minutes(unpacked_status[transmission_payload_status_timezone_offset_m])
+
+    status[transmission_payload_status_timestamp] = datetime.datetime.fromtimestamp(unpacked_status[transmission_payload_status_timestamp], tz)
+
+    status[transmission_payload_status_epoch] = _utc_epoch(unpacked_status[transmission_payload_status_epoch])
+
+    status[transmission_payload_status_mode] = SCM_DF_Transmission_Status_v1_0_Mode(
+        unpacked_status[transmission_payload_status_mode])
+
+    status[transmission_payload_status_timezone] = tz
+    status[transmission_payload_status_timezone_offset_m] = unpacked_status[transmission_payload_status_timezone_offset_m]
+
+
+# Each packet type gets its own specialized payload decoder, dispatched by a single
+# dict lookup instead of a chain of enum comparisons.
+PACKET_TYPE_DECODERS = {
+    SCM_DF_Transmission_Payload.SCM_DF_Transmission_Payload_Tracking_v1_0: decode_tracking_v1_0_payload,
+    SCM_DF_Transmission_Payload.SCM_DF_Transmission_Payload_Tracking_v2_0: decode_tracking_v2_0_payload,
+    SCM_DF_Transmission_Payload.SCM_DF_Transmission_Payload_Status_v1_0: decode_status_v1_0_payload,
+}
 
 def scm_processed_message_decode(message_hex, extra_id=0, service_flag=0, message_counter=0, crc16_ok=True, bch32_ok=True, epoch_year=2023):
     """
@@ -361,10 +538,12 @@ def scm_processed_message_decode(message_hex, extra_id=0, service_flag=0, messag
     :param message_counter: The processed message's message counter field.
     :param crc16_ok:
     :param bch32_ok:
-    :return: An OrderedDict containing the decoded and de-quantized data.
+    :return: A dict containing the decoded and de-quantized data.
     """
 
-    result = scm_raw_message_decode(pad_processed_message(message_hex), epoch_year)
+    # The caller supplies authoritative crc16_ok/bch32_ok flags below, so skip the
+    # re-encode and checksum verification whose result would be overwritten anyway.
+    result = scm_raw_message_decode(pad_processed_message(message_hex), epoch_year, validate_checksums=False)
     result[transmission_id] = extra_id
     result[transmission_SF] = service_flag
     result[transmission_MC] = message_counter
@@ -377,6 +556,25 @@ def scm_processed_message_decode(message_hex, extra_id=0, service_flag=0, messag
     return result
 
 
+# Pad strings and lengths used by pad_processed_message; the field sizes are fixed at
+# import time, so build them once instead of per message.
+_PAD_PREFIX = "0" * int((
+    SCM_DF_TRANSMISSION_ID_SIZE +
+    SCM_DF_TRANSMISSION_CRC16_SIZE +
+    SCM_DF_TRANSMISSION_SF_SIZE +
+    SCM_DF_TRANSMISSION_MC_SIZE
+) / 4)
+_PAD_SUFFIX = "0" * int(SCM_DF_TRANSMISSION_BCH32_SIZE / 4)
+_FULL_MESSAGE_BITS = SCM_DF_BUF_SIZE * 8
+_STRIPPED_MESSAGE_BITS = _FULL_MESSAGE_BITS - (
+    SCM_DF_TRANSMISSION_BCH32_SIZE +
+    SCM_DF_TRANSMISSION_CRC16_SIZE +
+    SCM_DF_TRANSMISSION_SF_SIZE +
+    SCM_DF_TRANSMISSION_MC_SIZE +
+    SCM_DF_TRANSMISSION_ID_SIZE
+)
+
+
 def pad_processed_message(processed_message_hex):
     """
     pad_processed_message takes the stripped down processed_message and add a prefix and suffix of 0x0s to pad the
@@ -385,50 +583,49 @@ def pad_processed_message(processed_message_hex):
     :param processed_message_hex: the hex string of the processed message
     :return: the processed message padded out to the required (SCM_DF_BUF_SIZE * 8) bits
     """
-    if (len(processed_message_hex) * 4) != SCM_DF_BUF_SIZE * 8:
-        if (len(processed_message_hex) * 4) == (
-                (SCM_DF_BUF_SIZE * 8) - (
-                SCM_DF_TRANSMISSION_BCH32_SIZE +
-                SCM_DF_TRANSMISSION_CRC16_SIZE +
-                SCM_DF_TRANSMISSION_SF_SIZE +
-                SCM_DF_TRANSMISSION_MC_SIZE +
-                SCM_DF_TRANSMISSION_ID_SIZE
-        )
-        ):
-            processed_message_hex = "{prefix}{message}{suffix}".format(
-                prefix="0" * int((
-                                         SCM_DF_TRANSMISSION_ID_SIZE +
-                                         SCM_DF_TRANSMISSION_CRC16_SIZE +
-                                         SCM_DF_TRANSMISSION_SF_SIZE +
-                                         SCM_DF_TRANSMISSION_MC_SIZE
-                                 ) / 4),
-                message=processed_message_hex,
-                suffix="0" * int(SCM_DF_TRANSMISSION_BCH32_SIZE / 4)
-            )
+    message_bits = len(processed_message_hex) * 4
+    if message_bits != _FULL_MESSAGE_BITS:
+        if message_bits == _STRIPPED_MESSAGE_BITS:
+            processed_message_hex = _PAD_PREFIX + processed_message_hex + _PAD_SUFFIX
 
     ensure_message_length(processed_message_hex)
 
     return processed_message_hex
 
 
+_EXPECTED_HEX_LENGTH = SCM_DF_BUF_SIZE * 2
+
+
 def ensure_message_length(message):
-    if (len(message) * 4) != SCM_DF_BUF_SIZE * 8:
+    if len(message) != (SCM_DF_BUF_SIZE if isinstance(message, (bytes, bytearray)) else _EXPECTED_HEX_LENGTH):
         raise InvalidMessageSize(
             "Expected message length of {} bytes, received {} bytes.".format(
-                SCM_DF_BUF_SIZE, (len(message) / 2)))
+                SCM_DF_BUF_SIZE, len(message) if isinstance(message, (bytes, bytearray)) else len(message) / 2))
 
 
-def scm_validate_checksums(decoded_message: OrderedDict):
-    crc16_calc = get_crc16_calculator()
-    bch32_calc = get_bch32_calculator()
-    _decoded_message = deepcopy(decoded_message)
+def scm_validate_checksums(decoded_message: dict, raw_message=None):
+    """
+    scm_validate_checksums verifies the CRC16 and BCH32 fields of decoded_message and
+    records the outcome in its verified fields. When the caller still holds the raw
+    message bytes the checksums are verified against those directly; otherwise the
+    message is re-encoded first.
+    :param decoded_message: The decoded message dict
+    :param raw_message: The original encoded message bytes, if available
+    :return: True when both checksums verify
+    """
+    crc16_calc = _CRC16_CALCULATOR
+    bch32_calc = _BCH32_CALCULATOR
 
-    encoded_message = scm_df_encode(_decoded_message)
-    bch32_message = encoded_message[:(SCM_DF_BUF_SIZE - int(SCM_DF_TRANSMISSION_BCH32_SIZE / 8))]
+    encoded_message = raw_message if raw_message is not None else scm_df_encode(decoded_message)
+    bch32_message = encoded_message[:_BCH32_MESSAGE_END]
 
-    _decoded_message[transmission_crc16] = 0
-    encoded_message = scm_df_encode(_decoded_message)
-    crc16_message = encoded_message[math.ceil(SCM_DF_TRANSMISSION_ID_SIZE / 8) : SCM_DF_BUF_SIZE - int(SCM_DF_TRANSMISSION_BCH32_SIZE/8)]
+    # The crc16 field spans bits 4..19 of the message. Zero those bits directly in the
+    # encoded buffer rather than re-encoding the whole message with crc16 = 0; within
+    # the slice below (which starts at byte 1) that is all of byte 0 and the high
+    # nibble of byte 1.
+    crc16_message = bytearray(encoded_message[_CRC16_MESSAGE_START:_BCH32_MESSAGE_END])
+    crc16_message[0] = 0
+    crc16_message[1] &= 0x0F
 
     decoded_message[transmission_crc16_verified] = crc16_calc.verify(crc16_message, decoded_message[transmission_crc16])
     decoded_message[transmission_bch32_verified] = bch32_calc.verify(bch32_message, decoded_message[transmission_bch32])
@@ -439,92 +636,82 @@ class InvalidMessageSize(Exception):
     pass
 
 
-@lru_cache(maxsize=2)
 def calculate_v1_0_battery_step():
     """
     calculate_battery_step calculates the quantized step value for each count of the battery field.
     :return: The step size
     """
-    return (SCM_DF_BAT_RANGE_HIGH - SCM_DF_BAT_RANGE_LOW) / (2 ** SCM_DF_TRACKING_V1_0_BATTERY_SIZE)
+    return V1_0_BATTERY_STEP
 
 
-@lru_cache(maxsize=2)
 def calculate_v1_0_temp_max_step():
     """
     calculate_temp_max_step calculates the quantized step value for each count of the temp_min field.
     :return:
     """
-    return (SCM_DF_TEMP_MAX_HIGH - SCM_DF_TEMP_MAX_LOW) / (2 ** SCM_DF_TRACKING_V1_0_TEMP_MAX_SIZE)
+    return V1_0_TEMP_MAX_STEP
 
 
-@lru_cache(maxsize=2)
 def calculate_v1_0_temp_min_step():
     """
     calculate_temp_min_step calculates the quantized step value for each count of the temp_min field.
     :return:
     """
-    return (SCM_DF_TEMP_MIN_HIGH - SCM_DF_TEMP_MIN_LOW) / (2 ** SCM_DF_TRACKING_V1_0_TEMP_MIN_SIZE)
+    return V1_0_TEMP_MIN_STEP
 
 
-@lru_cache(maxsize=2)
 def calculate_v1_0_point_delta_m_step():
     """
     calculate_point_delta_m_step calculates the quantized step value for each count of the point_delta_m field.
     :return:
     """
-    return Decimal('1000') / (2 ** SCM_DF_POINT_V1_0_DELTA_M_SIZE)
+    return V1_0_POINT_DELTA_M_STEP
 
 
-@lru_cache(maxsize=2)
 def calculate_v1_0_point_bearing_step():
     """
     calculate_point_bearing_step calculates the quantized step value for each count of the point_delta_angle field.
     :return:
     """
-    return Decimal('360') / (2 ** SCM_DF_POINT_V1_0_DELTA_ANGLE_SIZE)
+    return V1_0_POINT_BEARING_STEP
 
 
-@lru_cache(maxsize=2)
 def calculate_v2_0_battery_step():
     """
     calculate_battery_step calculates the quantized step value for each count of the battery field.
     :return: The step size
     """
-    return (SCM_DF_BAT_RANGE_HIGH - SCM_DF_BAT_RANGE_LOW) / (2 ** SCM_DF_TRACKING_V2_0_BATTERY_SIZE)
+    return V2_0_BATTERY_STEP
 
 
-@lru_cache(maxsize=2)
 def calculate_v2_0_temp_max_step():
     """
     calculate_temp_max_step calculates the quantized step value for each count of the temp_min field.
     :return:
     """
-    return (SCM_DF_TEMP_MAX_HIGH - SCM_DF_TEMP_MAX_LOW) / (2 ** SCM_DF_TRACKING_V2_0_TEMP_MAX_SIZE)
+    return V2_0_TEMP_MAX_STEP
 
 
-@lru_cache(maxsize=2)
 def calculate_v2_0_temp_min_step():
     """
     calculate_temp_min_step calculates the quantized step value for each count of the temp_min field.
     :return:
     """
-    return (SCM_DF_TEMP_MIN_HIGH - SCM_DF_TEMP_MIN_LOW) / (2 ** SCM_DF_TRACKING_V2_0_TEMP_MIN_SIZE)
+    return V2_0_TEMP_MIN_STEP
 
-@lru_cache(maxsize=2)
 def calculate_v2_0_point_delta_m_step():
     """
     calculate_point_delta_m_step calculates the quantized step value for each count of the point_delta_m field.
     :return:
     """
-    return Decimal('1000') / (2 ** SCM_DF_POINT_V1_0_DELTA_M_SIZE)
+    return V2_0_POINT_DELTA_M_STEP
 
-@lru_cache(maxsize=2)
 def calculate_v2_0_point_bearing_step():
     """
     calculate_point_bearing_step calculates the quantized step value for each count of the point_delta_angle field.
     :return:
     """
-    return Decimal('360') / (2 ** SCM_DF_POINT_V2_0_DELTA_ANGLE_SIZE)
+    return V2_0_POINT_BEARING_STEP
 
 
 def unpack_signed_int_32(value, shift):
@@ -535,10 +722,9 @@ def unpack_signed_int_32(value, shift):
     :param shift: The shift amount
     :return: C version of value << shift
     """
-    _value_h = hex(value << shift)[2:]
-    _value_h = _value_h.zfill(8)
-    _value_b = bytes.fromhex(_value_h)
-    return struct.unpack(">i", _value_b)
+    _value = (value << shift) & 0xFFFFFFFF
+    # Branchless two's-complement sign extension of the low 32 bits.
+    return ((_value ^ 0x80000000) - 0x80000000),
 
 
 if __name__ == "__main__":
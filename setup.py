@@ -30,7 +30,7 @@ setup(name='SCM_Utils',
       description='Utilities for the SCM Ear Tag Project.',
       author='NigelB',
       packages=find_packages(),
-      install_requires=["pytz", "tzlocal", "python-dateutil", "crc", "geographiclib", "geopy"],
+      install_requires=["pytz", "python-dateutil"],
       entry_points={
           "console_scripts": [
 
@@ -22,9 +22,6 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
-import json
-from copy import deepcopy
-from json import loads, dumps
 from unittest import TestCase
 
 from scm.generated.SCM_DF import BitQueue
@@ -115,11 +112,18 @@ class TestDecoder(TestCase):
         "decode_type": "raw"
     }
 
+    @classmethod
+    def setUpClass(cls):
+        # Decode the shared raw fixture once for every test that reads it.
+        cls.decoded_raw = scm_raw_message_decode(
+            cls.raw['values']['raw_data'],
+            DeviceEpoch().get_device_epoch(cls.raw['values']['device_id']))
+
     def test_decoder_raw(self):
-        message = scm_raw_message_decode(self.raw['values']['raw_data'], DeviceEpoch().get_device_epoch(self.raw['values']['device_id']))
+        message = self.decoded_raw
         self.assertTrue(message[transmission_crc16_verified])
         self.assertTrue(message[transmission_bch32_verified])
-        self.assertEqual(self.result, loads(dumps(message, cls=TransmissionEncoder)))
+        self.assertEqual(self.result, TransmissionEncoder.normalize(message))
 
     def test_decoder_processed(self):
         message = scm_processed_message_decode(
@@ -130,61 +134,278 @@ class TestDecoder(TestCase):
             crc16_ok=self.processed['values']['CRC_OK'],
             bch32_ok=self.processed['values']['checked'].upper() == "Y"
         )
-        answer = deepcopy(message)
+        # Only top-level keys are overwritten below; a shallow copy is enough.
+        answer = dict(message)
         answer[transmission_crc16] = self.result[transmission_crc16]
         answer[transmission_bch32] = self.result[transmission_bch32]
         answer[transmission_decoded_type] = transmission_decoded_raw_type
 
-        self.assertEqual(self.result, loads(dumps(answer, cls=TransmissionEncoder)))
+        self.assertEqual(self.result, TransmissionEncoder.normalize(answer))
         
-    def test_status_decode(self):
-        msg = "02642000132337907800003F384096000000000000000000000000B35E63CC".replace(" ", "")
-        message = scm_raw_message_decode(msg, DeviceEpoch().get_device_epoch(None))
-        from pprint import pprint
-        pprint(message)
-        print(json.dumps(message, cls=TransmissionEncoder))
-
-    def test_status_decode_2(self):
-        msg = "13260D9C0000003F3A0096000000000000000000000000".replace(" ", "")
-        message = scm_processed_message_decode(msg, DeviceEpoch().get_device_epoch(None))
-        from pprint import pprint
-        pprint(message)
-        print(json.dumps(message, cls=TransmissionEncoder))
-
-    def test_status_decode_nt_1(self):
-        msg = "087100401EF7F96B1001474D42800E10C010A003844000 ".replace(" ", "")
-        message = scm_processed_message_decode(msg, DeviceEpoch().get_device_epoch(None))
-        from pprint import pprint
-        pprint(message)
-        print(json.dumps(message, cls=TransmissionEncoder))
-
-    def test_status_decode_nt_2(self):
-        msg = "087100401EF7F96B1001874C42C00C07C0109003843000".replace(" ", "")
-        message = scm_processed_message_decode(msg, DeviceEpoch().get_device_epoch(None))
-        from pprint import pprint
-        pprint(message)
-        print(json.dumps(message, cls=TransmissionEncoder))
-
-
-    def test_status_decode_nt_3(self):
-        msg = "0870C8401EF7F96B1001800042000C1440107003029000".replace(" ", "")
-        message = scm_processed_message_decode(msg, DeviceEpoch().get_device_epoch(None))
-        from pprint import pprint
-        pprint(message)
-        print(json.dumps(message, cls=TransmissionEncoder))
-
-
-    def test_status_decode_nt_4(self):
-        msg = "087100401EF7F96B1001774E42C00E04C010A003051000".replace(" ", "")
-        message = scm_processed_message_decode(msg, DeviceEpoch().get_device_epoch(None))
-        from pprint import pprint
-        pprint(message)
-        print(json.dumps(message, cls=TransmissionEncoder))
-
-    def test_tracking_v2_raw_decoder(self):
-        msg = "0F4EE015085C0045FB87F6CDC001490842C0080B0010A002037000C4C7776C"
-        message = scm_raw_message_decode(msg.replace(" ", ""), DeviceEpoch().get_device_epoch(None))
-        from pprint import pprint
-        pprint(message)
-        print(json.dumps(message, cls=TransmissionEncoder))
+    # One case per message: (name, kind, hex, expected normalized decode). The
+    # expected dicts match what the pre-series baseline decoder produced for the
+    # same messages.
+    DECODE_CASES = [
+        ("status_decode", "raw",
+         "02642000132337907800003F384096000000000000000000000000B35E63CC",
+         {'id': 0,
+          'crc16': 9794,
+          'SF': 0,
+          'MC': 0,
+          'packet_type': 2,
+          'payload': {'status_v1_0': {'timestamp': '2023-05-19T13:50:39+1000',
+                                      'epoch': '2023-01-01T00:00:00+0000',
+                                      'mode': 1,
+                                      'timezone': 36000.0,
+                                      'timezone_offset_m': 600}},
+          'bch32': 3009307596,
+          'crc16_verified': True,
+          'bch32_verified': True,
+          'decode_type': 'raw'}),
+        ("status_decode_2", "processed",
+         "13260D9C0000003F3A0096000000000000000000000000",
+         {'id': 0,
+          'crc16': 0,
+          'SF': 0,
+          'MC': 0,
+          'packet_type': 2,
+          'payload': {'status_v1_0': {'timestamp': '2023-07-27T10:00:00+1000',
+                                      'epoch': '2023-01-01T00:00:00+0000',
+                                      'mode': 8,
+                                      'timezone': 36000.0,
+                                      'timezone_offset_m': 600}},
+          'bch32': 0,
+          'crc16_verified': True,
+          'bch32_verified': True,
+          'decode_type': 'processed'}),
+        ("status_decode_nt_1", "processed",
+         "087100401EF7F96B1001474D42800E10C010A003844000",
+         {'id': 0,
+          'crc16': 0,
+          'SF': 0,
+          'MC': 0,
+          'packet_type': 1,
+          'payload': {'tracking_v2_0': {'days_since_epoch': 226,
+                                        'timeslot': 0,
+                                        'timestamp': '2023-08-15T00:00:00+0000',
+                                        'longitude': '134.471168',
+                                        'latitude': '-13.803008',
+                                        'orientation': 0,
+                                        'activity': 0,
+                                        'battery': '4.00',
+                                        'temp_min': '14.5',
+                                        'temp_max': '26.5',
+                                        'temp_alert': False,
+                                        'points': [{'day_offset': 0,
+                                                    'timeslot': 20,
+                                                    'timestamp': '2023-08-15T20:00:00+0000',
+                                                    'delta_km': 0,
+                                                    'delta_m': '54.6875',
+                                                    'total_delta_m': '54.6875',
+                                                    'delta_angle': '11.77734375',
+                                                    'activity': 0,
+                                                    'temp_alert': False,
+                                                    'latitude': -13.802526537790097,
+                                                    'longitude': 134.47127136892195},
+                                                   {'day_offset': 0,
+                                                    'timeslot': 20,
+                                                    'timestamp': '2023-08-15T20:00:00+0000',
+                                                    'delta_km': 0,
+                                                    'delta_m': '54.6875',
+                                                    'total_delta_m': '54.6875',
+                                                    'delta_angle': '11.95312500',
+                                                    'activity': 0,
+                                                    'temp_alert': False,
+                                                    'latitude': -13.802526848029133,
+                                                    'longitude': 134.4712728894623}]}},
+          'bch32': 0,
+          'crc16_verified': True,
+          'bch32_verified': True,
+          'decode_type': 'processed'}),
+        ("status_decode_nt_2", "processed",
+         "087100401EF7F96B1001874C42C00C07C0109003843000",
+         {'id': 0,
+          'crc16': 0,
+          'SF': 0,
+          'MC': 0,
+          'packet_type': 1,
+          'payload': {'tracking_v2_0': {'days_since_epoch': 226,
+                                        'timeslot': 0,
+                                        'timestamp': '2023-08-15T00:00:00+0000',
+                                        'longitude': '134.471168',
+                                        'latitude': '-13.803008',
+                                        'orientation': 0,
+                                        'activity': 0,
+                                        'battery': '4.20',
+                                        'temp_min': '14.5',
+                                        'temp_max': '26.0',
+                                        'temp_alert': False,
+                                        'points': [{'day_offset': 0,
+                                                    'timeslot': 22,
+                                                    'timestamp': '2023-08-15T22:00:00+0000',
+                                                    'delta_km': 0,
+                                                    'delta_m': '46.8750',
+                                                    'total_delta_m': '46.8750',
+                                                    'delta_angle': '5.44921875',
+                                                    'activity': 0,
+                                                    'temp_alert': False,
+                                                    'latitude': -13.80258834870578,
+                                                    'longitude': 134.47120922284117},
+                                                   {'day_offset': 0,
+                                                    'timeslot': 18,
+                                                    'timestamp': '2023-08-15T18:00:00+0000',
+                                                    'delta_km': 0,
+                                                    'delta_m': '54.6875',
+                                                    'total_delta_m': '54.6875',
+                                                    'delta_angle': '11.77734375',
+                                                    'activity': 0,
+                                                    'temp_alert': False,
+                                                    'latitude': -13.802526537790097,
+                                                    'longitude': 134.47127136892195}]}},
+          'bch32': 0,
+          'crc16_verified': True,
+          'bch32_verified': True,
+          'decode_type': 'processed'}),
+        ("status_decode_nt_3", "processed",
+         "0870C8401EF7F96B1001800042000C1440107003029000",
+         {'id': 0,
+          'crc16': 0,
+          'SF': 0,
+          'MC': 0,
+          'packet_type': 1,
+          'payload': {'tracking_v2_0': {'days_since_epoch': 225,
+                                        'timeslot': 18,
+                                        'timestamp': '2023-08-14T18:00:00+0000',
+                                        'longitude': '134.471168',
+                                        'latitude': '-13.803008',
+                                        'orientation': 0,
+                                        'activity': 0,
+                                        'battery': '4.20',
+                                        'temp_min': '0.0',
+                                        'temp_max': '20.0',
+                                        'temp_alert': False,
+                                        'points': [{'day_offset': 0,
+                                                    'timeslot': 16,
+                                                    'timestamp': '2023-08-14T16:00:00+0000',
+                                                    'delta_km': 0,
+                                                    'delta_m': '46.8750',
+                                                    'total_delta_m': '46.8750',
+                                                    'delta_angle': '14.23828125',
+                                                    'activity': 0,
+                                                    'temp_alert': False,
+                                                    'latitude': -13.802599393261747,
+                                                    'longitude': 134.4712747669889},
+                                                   {'day_offset': 0,
+                                                    'timeslot': 14,
+                                                    'timestamp': '2023-08-14T14:00:00+0000',
+                                                    'delta_km': 0,
+                                                    'delta_m': '46.8750',
+                                                    'total_delta_m': '46.8750',
+                                                    'delta_angle': '7.20703125',
+                                                    'activity': 0,
+                                                    'temp_alert': False,
+                                                    'latitude': -13.802589774171906,
+                                                    'longitude': 134.4712224589357}]}},
+          'bch32': 0,
+          'crc16_verified': True,
+          'bch32_verified': True,
+          'decode_type': 'processed'}),
+        ("status_decode_nt_4", "processed",
+         "087100401EF7F96B1001774E42C00E04C010A003051000",
+         {'id': 0,
+          'crc16': 0,
+          'SF': 0,
+          'MC': 0,
+          'packet_type': 1,
+          'payload': {'tracking_v2_0': {'days_since_epoch': 226,
+                                        'timeslot': 0,
+                                        'timestamp': '2023-08-15T00:00:00+0000',
+                                        'longitude': '134.471168',
+                                        'latitude': '-13.803008',
+                                        'orientation': 0,
+                                        'activity': 0,
+                                        'battery': '4.15',
+                                        'temp_min': '14.5',
+                                        'temp_max': '27.0',
+                                        'temp_alert': False,
+                                        'points': [{'day_offset': 0,
+                                                    'timeslot': 22,
+                                                    'timestamp': '2023-08-15T22:00:00+0000',
+                                                    'delta_km': 0,
+                                                    'delta_m': '54.6875',
+                                                    'total_delta_m': '54.6875',
+                                                    'delta_angle': '3.33984375',
+                                                    'activity': 0,
+                                                    'temp_alert': False,
+                                                    'latitude': -13.802517019516818,
+                                                    'longitude': 134.47119750430775},
+                                                   {'day_offset': 0,
+                                                    'timeslot': 20,
+                                                    'timestamp': '2023-08-15T20:00:00+0000',
+                                                    'delta_km': 0,
+                                                    'delta_m': '46.8750',
+                                                    'total_delta_m': '46.8750',
+                                                    'delta_angle': '14.23828125',
+                                                    'activity': 0,
+                                                    'temp_alert': False,
+                                                    'latitude': -13.802599393261747,
+                                                    'longitude': 134.4712747669889}]}},
+          'bch32': 0,
+          'crc16_verified': True,
+          'bch32_verified': True,
+          'decode_type': 'processed'}),
+        ("tracking_v2_raw_decoder", "raw",
+         "0F4EE015085C0045FB87F6CDC001490842C0080B0010A002037000C4C7776C",
+         {'id': 0,
+          'crc16': 62702,
+          'SF': 0,
+          'MC': 21,
+          'packet_type': 1,
+          'payload': {'tracking_v2_0': {'days_since_epoch': 184,
+                                        'timeslot': 0,
+                                        'timestamp': '2023-07-04T00:00:00+0000',
+                                        'longitude': '146.763776',
+                                        'latitude': '-19.286016',
+                                        'orientation': 0,
+                                        'activity': 0,
+                                        'battery': '4.00',
+                                        'temp_min': '18.0',
+                                        'temp_max': '24.0',
+                                        'temp_alert': False,
+                                        'points': [{'day_offset': 0,
+                                                    'timeslot': 22,
+                                                    'timestamp': '2023-07-04T22:00:00+0000',
+                                                    'delta_km': 0,
+                                                    'delta_m': '31.2500',
+                                                    'total_delta_m': '31.2500',
+                                                    'delta_angle': '7.73437500',
+                                                    'activity': 0,
+                                                    'temp_alert': False,
+                                                    'latitude': -19.285737519092336,
+                                                    'longitude': 146.76381607089024},
+                                                   {'day_offset': 0,
+                                                    'timeslot': 20,
+                                                    'timestamp': '2023-07-04T20:00:00+0000',
+                                                    'delta_km': 0,
+                                                    'delta_m': '31.2500',
+                                                    'total_delta_m': '31.2500',
+                                                    'delta_angle': '9.66796875',
+                                                    'activity': 0,
+                                                    'temp_alert': False,
+                                                    'latitude': -19.28573895382236,
+                                                    'longitude': 146.76382600298425}]}},
+          'bch32': 3301406572,
+          'crc16_verified': True,
+          'bch32_verified': True,
+          'decode_type': 'raw'}),
+    ]
 
+    def test_decoded_payloads(self):
+        epoch_year = DeviceEpoch().get_device_epoch(None)
+        for name, kind, msg, expected in self.DECODE_CASES:
+            with self.subTest(name=name):
+                if kind == "raw":
+                    message = scm_raw_message_decode(msg, epoch_year)
+                else:
+                    message = scm_processed_message_decode(msg, epoch_year=epoch_year)
+                self.assertEqual(expected, TransmissionEncoder.normalize(message))
@@ -0,0 +1,53 @@
+# SCM_Utils is a library of utilities for the Space Cows Project
+#
+# MIT License
+#
+# Copyright (c) 2023 eResearch Centre, James Cook University
+# Author: Nigel Bajema
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import unittest
+
+from scm.utils.scm_msg import great_circle_destination
+
+
+class TestGreatCircleDestination(unittest.TestCase):
+    # Expected values were produced by geopy's
+    # great_circle(meters=...).destination(Point(lat, lon), bearing), which the inline
+    # implementation must reproduce bit for bit.
+    def test_short_hop(self):
+        latitude, longitude = great_circle_destination(-19.25, 146.75, 45.0, 1500.0)
+        self.assertEqual(latitude, -19.24046099016243)
+        self.assertEqual(longitude, 146.76010304955778)
+
+    def test_long_hop(self):
+        latitude, longitude = great_circle_destination(-19.25, 146.75, 278.4375, 60250.0)
+        self.assertEqual(latitude, -19.169621626723927)
+        self.assertEqual(longitude, 146.18255907343388)
+
+    def test_antimeridian_wrap(self):
+        latitude, longitude = great_circle_destination(60.0, 179.9, 90.0, 50000.0)
+        self.assertEqual(latitude, 59.99694399158025)
+        self.assertEqual(longitude, -179.2007350485292)
+
+    def test_zero_distance(self):
+        latitude, longitude = great_circle_destination(-19.25, 146.75, 123.0, 0.0)
+        self.assertEqual(latitude, -19.25)
+        self.assertEqual(longitude, 146.75)